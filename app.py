@@ -9,9 +9,37 @@ import uuid
 import eventlet
 import gc
 import time
+import itertools
+from contextlib import contextmanager
 from functools import lru_cache
+from sqlalchemy import inspect
 
-eventlet.monkey_patch()
+# Startup pipeline state: per-phase timings (ms) and readiness flag
+startup_state = {
+    'ready': False,
+    'error': None,
+    'phases': {}
+}
+
+def record_phase(name, started):
+    startup_state['phases'][name] = round((time.perf_counter() - started) * 1000, 2)
+
+@contextmanager
+def startup_phase(name):
+    started = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        # Only expose the phase name; the full exception goes to the log
+        startup_state['error'] = f'{name} failed'
+        raise
+    finally:
+        record_phase(name, started)
+
+with startup_phase('monkey_patch'):
+    eventlet.monkey_patch()
+
+app_setup_started = time.perf_counter()
 
 app = Flask(__name__, static_folder='client/build', static_url_path='')
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'fuckingneonticktactoe')
@@ -40,6 +68,8 @@ class User(UserMixin, db.Model):
     username = db.Column(db.String(80), unique=True, nullable=False)
     password_hash = db.Column(db.String(128), nullable=False)
 
+record_phase('app_setup', app_setup_started)
+
 # Game rooms in memory
 active_rooms = {}
 
@@ -77,7 +107,8 @@ def board_to_tuple(board):
     return tuple(0 if cell is None else (1 if cell == 'X' else 2) for cell in board)
 
 # Cache minimax results to avoid recalculating the same positions
-@lru_cache(maxsize=10000)
+# (sized to hold every position visited by warm_ai_cache, ~24k entries)
+@lru_cache(maxsize=32768)
 def cached_minimax(board_tuple, depth, is_maximizing, alpha, beta):
     # Convert tuple back to board format
     board = [None if cell == 0 else ('X' if cell == 1 else 'O') for cell in board_tuple]
@@ -176,11 +207,71 @@ def get_ai_move(board):
     
     return best_move
 
+def warm_ai_cache():
+    # get_ai_move only runs minimax once 6 or fewer cells are empty, always
+    # from a board where O has just moved (equal X and O counts), so
+    # precompute every such non-terminal position
+    positions = 0
+    for cells in itertools.product((None, 'X', 'O'), repeat=9):
+        board = list(cells)
+        empty = board.count(None)
+        if empty == 0 or empty > 6 or board.count('X') != board.count('O'):
+            continue
+        if check_winner(board):
+            continue
+        minimax(board, 0, False)
+        positions += 1
+    return positions
+
+def ensure_schema():
+    # Only run create_all when a table is actually missing
+    inspector = inspect(db.engine)
+    missing = [name for name in db.metadata.tables if not inspector.has_table(name)]
+    if missing:
+        db.create_all()
+    # Don't hand pooled connections from a preloading master to forked workers
+    db.engine.dispose()
+    return missing
+
+def run_startup():
+    started = time.perf_counter()
+    try:
+        with startup_phase('schema'):
+            with app.app_context():
+                missing = ensure_schema()
+        if missing:
+            print(f"Created missing tables: {', '.join(missing)}")
+        with startup_phase('ai_warmup'):
+            positions = warm_ai_cache()
+        print(f"AI cache warmed: {positions} positions, {cached_minimax.cache_info().currsize} entries")
+        startup_state['ready'] = True
+    except Exception as e:
+        print(f"Error during startup: {str(e)}")
+        # Re-raise so the process exits and the platform restarts it
+        raise
+    finally:
+        record_phase('startup', started)
+        report = ', '.join(f"{name}: {ms}ms" for name, ms in startup_state['phases'].items())
+        print(f"Startup {'completed' if startup_state['ready'] else 'failed'} ({report})")
+
 # Routes
 @app.route('/')
 def index():
     return send_from_directory(app.static_folder, 'index.html')
 
+@app.route('/healthz')
+def healthz():
+    return jsonify({'status': 'ok'}), 200
+
+@app.route('/readyz')
+def readyz():
+    status = 200 if startup_state['ready'] else 503
+    return jsonify({
+        'status': 'ready' if startup_state['ready'] else 'not ready',
+        'error': startup_state['error'],
+        'phases': startup_state['phases']
+    }), status
+
 @app.route('/api/register', methods=['POST'])
 def register():
     data = request.get_json()
@@ -634,8 +725,7 @@ def cleanup_memory():
         last_cleanup_time = current_time
 
 if __name__ == '__main__':
-    with app.app_context():
-        db.create_all()
+    run_startup()
     socketio.run(app, debug=False)
 else:
     # For production on Render
@@ -660,6 +750,7 @@ else:
             gc.collect()
             last_cleanup_time = current_time
     
-    # Create database tables if they don't exist
-    with app.app_context():
-        db.create_all()
+    # Check schema and warm the AI cache before the worker accepts traffic.
+    # With --preload this runs once in the master and forked workers
+    # (including --max-requests recycles) inherit the warm cache.
+    run_startup()